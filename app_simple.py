@@ -8,11 +8,6 @@ from dotenv import load_dotenv
 # Cargar variables de entorno
 load_dotenv()
 
-# Importar módulos personalizados
-from modulos.buscador_alternative import realizar_busqueda, obtener_texto_completo
-from modulos.procesador import generar_resumen, preprocesar_texto_para_wordcloud
-from modulos.visualizador_simple import contar_palabras_frecuentes, generar_tabla_html
-
 # Configuración de la página
 st.set_page_config(
     page_title="Asistente de Investigación Digital",
@@ -46,6 +41,13 @@ with st.form("formulario_busqueda"):
 
 # Procesar la búsqueda cuando se envía el formulario
 if boton_buscar and tema:
+    # Importar módulos personalizados solo cuando hay una búsqueda que procesar;
+    # así la primera carga de la página (antes de cualquier búsqueda) no paga su costo.
+    # En los reruns posteriores ya están en sys.modules y la importación es inmediata
+    from modulos.buscador_alternative import realizar_busqueda, obtener_texto_completo
+    from modulos.procesador import generar_resumen, preprocesar_texto_para_wordcloud
+    from modulos.visualizador_simple import contar_palabras_frecuentes, generar_tabla_html
+    
     # Crear contenedor para mostrar estado
     estado = st.empty()
     
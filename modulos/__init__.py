@@ -2,10 +2,22 @@
 Paquete de módulos para el asistente de investigación digital.
 """
 # Este archivo hace que el directorio 'modulos' sea reconocido como un paquete Python
-# Importamos los módulos para facilitar su acceso
-from . import buscador_alternative
-from . import procesador
-from . import visualizador_simple
+# Los submódulos se importan de forma diferida (la primera vez que se accede a ellos)
+# para no pagar su costo de importación al cargar el paquete
 
 # Definir explícitamente qué módulos se pueden importar
-__all__ = ['buscador_alternative', 'procesador', 'visualizador_simple']
\ No newline at end of file
+__all__ = ['buscador_alternative', 'procesador', 'visualizador_simple']
+
+def __getattr__(nombre: str):
+    """
+    Importa un submódulo la primera vez que se accede a él como atributo del paquete.
+    """
+    if nombre in __all__:
+        from importlib import import_module
+        modulo = import_module(f".{nombre}", __name__)
+        globals()[nombre] = modulo
+        return modulo
+    raise AttributeError(f"module {__name__!r} has no attribute {nombre!r}")
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -2,9 +2,7 @@
 Módulo alternativo para realizar búsquedas web con manejo de errores mejorado.
 """
 import os
-import requests
 from typing import List, Dict, Any
-import json
 import time
 import random
 
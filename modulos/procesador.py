@@ -3,8 +3,22 @@ Módulo para procesar texto utilizando OpenAI y generar resúmenes.
 """
 import os
 from typing import List, Dict, Any
-import openai
-from openai import OpenAI
+
+def _crear_cliente(api_key: str):
+    """
+    Crea el cliente de OpenAI importando la librería solo cuando se necesita.
+    
+    En modo simulado (sin clave API) nunca se importa openai, lo que reduce
+    el tiempo de arranque de la aplicación.
+    
+    Args:
+        api_key (str): Clave API de OpenAI.
+        
+    Returns:
+        OpenAI: Cliente inicializado.
+    """
+    from openai import OpenAI
+    return OpenAI(api_key=api_key)
 
 def generar_resumen(texto: str, tema: str) -> str:
     """
@@ -38,7 +52,7 @@ def generar_resumen(texto: str, tema: str) -> str:
     
     try:
         # Inicializar el cliente de OpenAI
-        cliente = OpenAI(api_key=api_key)
+        cliente = _crear_cliente(api_key)
         
         # Limitar el texto para no exceder los tokens
         texto_limitado = texto[:8000]
@@ -134,7 +148,7 @@ def preprocesar_texto_para_wordcloud(texto: str) -> str:
     if api_key:
         try:
             # Inicializar el cliente de OpenAI
-            cliente = OpenAI(api_key=api_key)
+            cliente = _crear_cliente(api_key)
             
             # Limitar el texto para no exceder los tokens
             texto_limitado = texto[:5000]
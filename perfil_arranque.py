@@ -0,0 +1,257 @@
+"""
+Herramienta para perfilar el tiempo de arranque de la aplicación.
+
+Para cada objetivo (un módulo o un script .py) reporta:
+- El arranque en frío: tiempo de un intérprete nuevo que importa el módulo o
+  ejecuta el script, comparado con un intérprete vacío (ambos sin instrumentar).
+- Para scripts, la primera ejecución y los reruns dentro del mismo proceso, con
+  `sys.modules` ya cargado, como hace Streamlit en cada interacción.
+- El tiempo de importación de cada módulo según `python -X importtime`, sin los
+  módulos que el intérprete ya carga al arrancar.
+
+Uso:
+    python perfil_arranque.py
+    python perfil_arranque.py modulos.procesador --top 15 --repeticiones 5
+    python perfil_arranque.py app_simple.py
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+from typing import Dict, List, Set, Tuple
+
+# Objetivos que se perfilan si no se indica ninguno
+OBJETIVOS_POR_DEFECTO = [
+    "modulos",
+    "modulos.buscador_alternative",
+    "modulos.procesador",
+    "modulos.visualizador_simple",
+    "app_simple.py",
+]
+
+DIRECTORIO = os.path.dirname(os.path.abspath(__file__))
+
+# Ejecuta un script varias veces en el mismo proceso e imprime la duración de cada ejecución
+CODIGO_RERUNS = """
+import runpy, time
+tiempos = []
+for _ in range({ejecuciones}):
+    inicio = time.perf_counter()
+    runpy.run_path({ruta!r}, run_name="__main__")
+    tiempos.append((time.perf_counter() - inicio) * 1000)
+print("tiempos:", " ".join(f"{{t:.3f}}" for t in tiempos))
+"""
+
+def codigo_para(objetivo: str) -> str:
+    """
+    Devuelve el código Python que carga el objetivo en un intérprete nuevo.
+
+    Args:
+        objetivo (str): Nombre de un módulo o ruta a un script .py.
+
+    Returns:
+        str: Código para pasar a `python -c`.
+    """
+    if objetivo.endswith(".py"):
+        return f"import runpy; runpy.run_path({objetivo!r}, run_name='__main__')"
+    return f"import {objetivo}"
+
+def ejecutar(argumentos: List[str]) -> subprocess.CompletedProcess:
+    """
+    Ejecuta un intérprete nuevo con los argumentos indicados.
+
+    Args:
+        argumentos (List[str]): Argumentos para el intérprete.
+
+    Returns:
+        subprocess.CompletedProcess: Resultado del proceso.
+
+    Raises:
+        RuntimeError: Si el proceso termina con error.
+    """
+    proceso = subprocess.run(
+        [sys.executable] + argumentos,
+        cwd=DIRECTORIO,
+        capture_output=True,
+        text=True
+    )
+    if proceso.returncode != 0:
+        # La última línea del error suele ser la más informativa (p. ej. ModuleNotFoundError)
+        lineas_error = [l for l in proceso.stderr.splitlines() if not l.startswith("import time:")]
+        mensaje = lineas_error[-1] if lineas_error else "error desconocido"
+        raise RuntimeError(mensaje)
+    return proceso
+
+def medir_arranque(codigo: str, repeticiones: int) -> Tuple[float, float, float]:
+    """
+    Mide un intérprete nuevo que ejecuta el código, sin instrumentar.
+
+    Cada medición se alterna con la de un intérprete vacío para que las variaciones
+    de la máquina afecten a ambas por igual.
+
+    Args:
+        codigo (str): Código para pasar a `python -c`.
+        repeticiones (int): Número de mediciones a realizar.
+
+    Returns:
+        Tuple[float, float, float]: Mediana del intérprete vacío, del objetivo y
+        de la diferencia entre cada par de mediciones, en milisegundos.
+    """
+    # Una ejecución previa descartada para que los .pyc y la caché del disco estén listos
+    ejecutar(["-c", codigo])
+    vacios = []
+    objetivos = []
+    for _ in range(repeticiones):
+        for codigo_medido, mediciones in (("pass", vacios), (codigo, objetivos)):
+            inicio = time.perf_counter()
+            ejecutar(["-c", codigo_medido])
+            mediciones.append((time.perf_counter() - inicio) * 1000)
+    diferencias = [o - v for v, o in zip(vacios, objetivos)]
+    return statistics.median(vacios), statistics.median(objetivos), statistics.median(diferencias)
+
+def leer_importtime(codigo: str) -> Dict[str, Tuple[int, int]]:
+    """
+    Ejecuta el código con `-X importtime` y recoge los tiempos de cada módulo.
+
+    Args:
+        codigo (str): Código para pasar a `python -c`.
+
+    Returns:
+        Dict[str, Tuple[int, int]]: Tiempo propio y acumulado (en microsegundos)
+        de cada módulo importado.
+    """
+    proceso = ejecutar(["-X", "importtime", "-c", codigo])
+
+    tiempos = {}
+    for linea in proceso.stderr.splitlines():
+        # Formato: "import time: <propio> | <acumulado> | <nombre>"
+        if not linea.startswith("import time:"):
+            continue
+        partes = linea[len("import time:"):].split("|")
+        if len(partes) != 3 or not partes[0].strip().isdigit():
+            continue
+        propio, acumulado, nombre = int(partes[0]), int(partes[1]), partes[2].strip()
+        tiempos[nombre] = (propio, acumulado)
+
+    return tiempos
+
+def medir_importaciones(codigo: str, repeticiones: int,
+                        excluidos: Set[str]) -> Dict[str, Tuple[float, float]]:
+    """
+    Calcula la mediana del tiempo de importación de cada módulo en varias ejecuciones.
+
+    Args:
+        codigo (str): Código para pasar a `python -c`.
+        repeticiones (int): Número de ejecuciones instrumentadas.
+        excluidos (Set[str]): Módulos a omitir (los que carga el intérprete al arrancar).
+
+    Returns:
+        Dict[str, Tuple[float, float]]: Mediana del tiempo propio y acumulado
+        (en microsegundos) de cada módulo.
+    """
+    muestras = {}
+    for _ in range(repeticiones):
+        for nombre, tiempos in leer_importtime(codigo).items():
+            if nombre not in excluidos:
+                muestras.setdefault(nombre, []).append(tiempos)
+
+    return {
+        nombre: (statistics.median(t[0] for t in lista), statistics.median(t[1] for t in lista))
+        for nombre, lista in muestras.items()
+    }
+
+def medir_reruns(ruta: str, repeticiones: int) -> Tuple[float, float]:
+    """
+    Mide la primera ejecución de un script y sus reruns dentro del mismo proceso.
+
+    Args:
+        ruta (str): Ruta al script.
+        repeticiones (int): Número de procesos a lanzar; cada uno ejecuta el script
+            una vez en frío y `repeticiones` veces más con `sys.modules` cargado.
+
+    Returns:
+        Tuple[float, float]: Mediana de la primera ejecución y de los reruns, en milisegundos.
+    """
+    primeras = []
+    reruns = []
+    codigo = CODIGO_RERUNS.format(ejecuciones=repeticiones + 1, ruta=ruta)
+    for _ in range(repeticiones):
+        proceso = ejecutar(["-c", codigo])
+        linea = [l for l in proceso.stdout.splitlines() if l.startswith("tiempos:")][-1]
+        tiempos = [float(t) for t in linea[len("tiempos:"):].split()]
+        primeras.append(tiempos[0])
+        reruns.extend(tiempos[1:])
+    return statistics.median(primeras), statistics.median(reruns)
+
+def perfilar(objetivos: List[str], top: int, repeticiones: int) -> int:
+    """
+    Perfila cada objetivo e imprime un reporte con los módulos más costosos.
+
+    Args:
+        objetivos (List[str]): Módulos o scripts .py a perfilar.
+        top (int): Número de módulos a mostrar en el detalle.
+        repeticiones (int): Número de mediciones por objetivo.
+
+    Returns:
+        int: Código de salida (0 si todos los objetivos se pudieron cargar).
+    """
+    excluidos = set(leer_importtime("pass"))
+
+    codigo_salida = 0
+    for indice, objetivo in enumerate(objetivos):
+        if indice:
+            print()
+        print(f"== {objetivo} ==")
+        codigo = codigo_para(objetivo)
+        try:
+            vacio_ms, arranque_ms, diferencia_ms = medir_arranque(codigo, repeticiones)
+            tiempos = medir_importaciones(codigo, repeticiones, excluidos)
+            if objetivo.endswith(".py"):
+                primera_ms, rerun_ms = medir_reruns(objetivo, repeticiones)
+        except RuntimeError as e:
+            print(f"No se pudo cargar '{objetivo}': {e}")
+            codigo_salida = 1
+            continue
+
+        print(f"Arranque en frío: {arranque_ms:.1f} ms, intérprete vacío: {vacio_ms:.1f} ms, "
+              f"diferencia: {diferencia_ms:.1f} ms (medianas de {repeticiones} pares)")
+        if objetivo.endswith(".py"):
+            print(f"Primera ejecución: {primera_ms:.1f} ms, rerun: {rerun_ms:.1f} ms "
+                  f"(medianas, mismo proceso)")
+
+        # Ordenar por la mediana del tiempo acumulado
+        ordenados = sorted(tiempos.items(), key=lambda item: item[1][1], reverse=True)
+        print(f"{'acumulado (ms)':>15} {'propio (ms)':>12}  módulo  "
+              f"(medianas de {repeticiones} ejecuciones con -X importtime)")
+        for nombre, (propio, acumulado) in ordenados[:top]:
+            print(f"{acumulado / 1000:>15.2f} {propio / 1000:>12.2f}  {nombre}")
+
+    return codigo_salida
+
+def entero_positivo(valor: str) -> int:
+    """
+    Convierte un argumento de línea de comandos en un entero mayor que cero.
+    """
+    try:
+        numero = int(valor)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"'{valor}' no es un entero")
+    if numero < 1:
+        raise argparse.ArgumentTypeError(f"debe ser mayor que cero: {numero}")
+    return numero
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Reporta el tiempo de arranque y de importación por módulo.")
+    parser.add_argument("objetivos", nargs="*", default=OBJETIVOS_POR_DEFECTO,
+                        help="Módulos o scripts .py a perfilar (por defecto, el paquete 'modulos' y app_simple.py).")
+    parser.add_argument("--top", type=entero_positivo, default=10,
+                        help="Número de módulos a mostrar por cada objetivo.")
+    parser.add_argument("--repeticiones", type=entero_positivo, default=5,
+                        help="Número de mediciones por objetivo.")
+    args = parser.parse_args()
+    return perfilar(args.objetivos, args.top, args.repeticiones)
+
+if __name__ == "__main__":
+    sys.exit(main())